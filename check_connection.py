@@ -1,126 +1,236 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -B
 """
 Combined Device Connection Checker
 Verifies both Thorlabs stage and xtralien four-point probe are ready.
 Homes the stage if needed.
 """
 
+import asyncio
 import sys
 import time
+from contextlib import closing
 
 # Device ports
 STAGE_PORT = "/dev/ttyUSB0"
 PROBE_PORT = "/dev/ttyACM0"
 
-def check_stage():
-    """Check Thorlabs stage connection and home if needed."""
-    print("\n" + "="*50)
-    print("  CHECKING THORLABS STAGE")
-    print("="*50)
+STAGE_POLL_INTERVAL = 0.1  # Seconds between stage status polls during moves/homing
+
+
+def enable_low_latency(port, ser=None):
+    """Set ASYNC_LOW_LATENCY on a USB serial port (skips the 16ms latency timer)."""
+    # Preferred: pyserial's own helper on the already-open handle
+    if ser is not None and hasattr(ser, "set_low_latency_mode"):
+        try:
+            ser.set_low_latency_mode(True)
+            return True
+        except Exception:
+            pass
     
+    # Fallback: TIOCGSERIAL/TIOCSSERIAL ioctl pair on the tty (Linux only)
     try:
-        from pylablib.devices import Thorlabs
+        import array
+        import fcntl
+        import os
+        import termios
         
-        print(f"Connecting to {STAGE_PORT}...")
-        stage = Thorlabs.KinesisMotor(STAGE_PORT, is_rack_system=False)
-        print("✓ Stage connected successfully!")
+        ASYNC_LOW_LATENCY = 0x2000  # from <linux/serial.h>
         
-        # Enable the stage
-        stage._enable_channel()
-        time.sleep(0.3)
+        fd = os.open(port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            # struct serial_struct as ints; 'flags' is the 5th field
+            buf = array.array('i', [0] * 32)
+            fcntl.ioctl(fd, termios.TIOCGSERIAL, buf)
+            buf[4] |= ASYNC_LOW_LATENCY
+            fcntl.ioctl(fd, termios.TIOCSSERIAL, buf)
+        finally:
+            os.close(fd)
+        return True
+    except Exception:
+        # Not a Linux tty or driver doesn't support it - stay on default latency
+        return False
+
+
+async def await_device(fut):
+    """Await a device call running in an executor thread.
+    
+    On cancellation (Ctrl-C, even repeated) the call is allowed to finish
+    first, so the device is never closed while a worker thread is still
+    using it. Only use this for short calls; long stage waits go through
+    wait_stage.
+    """
+    try:
+        return await asyncio.shield(fut)
+    except asyncio.CancelledError:
+        while not fut.done():
+            try:
+                await asyncio.wait([fut])
+            except asyncio.CancelledError:
+                pass
+        raise
+
+
+async def wait_stage(stage, busy, timeout=None, out=print):
+    """Wait until busy() (e.g. stage.is_moving) reports the stage idle.
+    
+    The stage is polled with short calls instead of blocking in
+    wait_move/wait_for_home, so Ctrl-C is handled within one poll: the
+    stage is stopped and the wait returns once it has halted.
+    """
+    loop = asyncio.get_running_loop()
+    start = time.monotonic()
+    try:
+        while await await_device(loop.run_in_executor(None, busy)):
+            if timeout is not None and time.monotonic() - start > timeout:
+                raise TimeoutError(f"Stage still busy after {timeout}s")
+            await asyncio.sleep(STAGE_POLL_INTERVAL)
+    except asyncio.CancelledError:
+        out("\nStopping stage, waiting for stage...")
+        await await_device(loop.run_in_executor(None, stage.stop))
+        raise
+
+
+async def check_stage(out=print):
+    """Check Thorlabs stage connection and home if needed."""
+    out("\n" + "="*50)
+    out("  CHECKING THORLABS STAGE")
+    out("="*50)
+    
+    try:
+        from pylablib.devices import Thorlabs
         
-        # Check current status
-        current_pos = stage.get_position()
-        is_homed = stage.is_homed()
+        # Blocking device calls run in the executor so check_probe can progress
+        loop = asyncio.get_running_loop()
         
-        print(f"Current Position: {current_pos} steps")
-        print(f"Is Homed: {is_homed}")
+        def call(func, *args):
+            return await_device(loop.run_in_executor(None, func, *args))
         
-        # Home if needed
-        if not is_homed:
-            print("\n⚠ Stage is NOT homed. Starting homing sequence...")
-            print("(Watch for physical movement - this may take up to 2 minutes)")
+        out(f"Connecting to {STAGE_PORT}...")
+        stage = await call(lambda: Thorlabs.KinesisMotor(STAGE_PORT, is_rack_system=False))
+        with closing(stage):
+            out("✓ Stage connected successfully!")
             
-            stage.home(sync=False)
-            time.sleep(1)
+            # Reduce USB round-trip latency (pylablib's backend wraps serial.Serial)
+            if not enable_low_latency(STAGE_PORT, getattr(getattr(stage, "instr", None), "instr", None)):
+                out(f"Note: low-latency mode unavailable on {STAGE_PORT}, using default USB latency")
             
-            status = stage.get_status()
-            print(f"Homing status: {status}")
+            # Enable the stage
+            await call(stage._enable_channel)
+            await asyncio.sleep(0.3)
             
-            stage.wait_for_home(timeout=120)
-            print("✓ Homing complete!")
+            # Check current status
+            current_pos = await call(stage.get_position)
+            is_homed = await call(stage.is_homed)
             
-            final_pos = stage.get_position()
-            print(f"Final Position: {final_pos} steps (should be near 0)")
-        else:
-            print("✓ Stage is already homed.")
+            out(f"Current Position: {current_pos} steps")
+            out(f"Is Homed: {is_homed}")
             
-            # Move to home position if not there
-            if abs(current_pos) > 10:
-                print("Moving to home position (0)...")
-                stage.move_to(0)
-                stage.wait_move()
-                print(f"✓ At home position: {stage.get_position()} steps")
+            # Home if needed
+            if not is_homed:
+                out("\n⚠ Stage is NOT homed. Starting homing sequence...")
+                out("(Watch for physical movement - this may take up to 2 minutes)")
+                
+                await call(lambda: stage.home(sync=False))
+                await asyncio.sleep(1)
+                
+                status = await call(stage.get_status)
+                out(f"Homing status: {status}")
+                
+                await wait_stage(stage, stage.is_homing, timeout=120, out=out)
+                if not await call(stage.is_homed):
+                    raise RuntimeError("Homing stopped before the stage was homed")
+                out("✓ Homing complete!")
+                
+                final_pos = await call(stage.get_position)
+                out(f"Final Position: {final_pos} steps (should be near 0)")
             else:
-                print("✓ Already at home position.")
-        
-        stage.close()
-        print("\n✓ STAGE CHECK PASSED - Ready for measurements!")
+                out("✓ Stage is already homed.")
+                
+                # Move to home position if not there
+                if abs(current_pos) > 10:
+                    out("Moving to home position (0)...")
+                    await call(stage.move_to, 0)
+                    await wait_stage(stage, stage.is_moving, out=out)
+                    out(f"✓ At home position: {await call(stage.get_position)} steps")
+                else:
+                    out("✓ Already at home position.")
+            
+        out("\n✓ STAGE CHECK PASSED - Ready for measurements!")
         return True
         
     except ImportError:
-        print("\n✗ ERROR: pylablib not installed")
-        print("Install with: pip install pylablib")
+        out("\n✗ ERROR: pylablib not installed")
+        out("Install with: pip install pylablib")
         return False
         
     except Exception as e:
-        print(f"\n✗ ERROR: {e}")
-        print("\nTROUBLESHOOTING:")
-        print("1. Check USB connection to stage")
-        print("2. Run: sudo chmod 666 /dev/ttyUSB0")
-        print("3. Unplug and replug USB if device is busy")
+        out(f"\n✗ ERROR: {e}")
+        out("\nTROUBLESHOOTING:")
+        out("1. Check USB connection to stage")
+        out("2. Run: sudo chmod 666 /dev/ttyUSB0")
+        out("3. Unplug and replug USB if device is busy")
         return False
 
 
-def check_probe():
+async def check_probe(out=print):
     """Check xtralien four-point probe connection."""
-    print("\n" + "="*50)
-    print("  CHECKING FOUR-POINT PROBE")
-    print("="*50)
+    out("\n" + "="*50)
+    out("  CHECKING FOUR-POINT PROBE")
+    out("="*50)
     
     try:
         import xtralien
         
-        print(f"Connecting to {PROBE_PORT}...")
-        device = xtralien.Device(PROBE_PORT)
-        print("✓ Probe connected successfully!")
+        loop = asyncio.get_running_loop()
         
-        # Test basic communication
-        response = device.cloi.hello()
-        print(f"Device response: {response}")
+        def call(func, *args):
+            return await_device(loop.run_in_executor(None, func, *args))
         
-        # Check temperature sensor
-        temp = device.temp.read()
-        print(f"Board Temperature: {temp}°C")
-        
-        device.close()
-        print("\n✓ PROBE CHECK PASSED - Ready for measurements!")
+        out(f"Connecting to {PROBE_PORT}...")
+        device = await call(xtralien.Device, PROBE_PORT)
+        with closing(device):
+            out("✓ Probe connected successfully!")
+            
+            # Reduce USB round-trip latency
+            if not enable_low_latency(PROBE_PORT, getattr(device, "connection", None)):
+                out(f"Note: low-latency mode unavailable on {PROBE_PORT}, using default USB latency")
+            
+            # Test basic communication
+            response = await call(device.cloi.hello)
+            out(f"Device response: {response}")
+            
+            # Check temperature sensor
+            temp = await call(device.temp.read)
+            out(f"Board Temperature: {temp}°C")
+            
+        out("\n✓ PROBE CHECK PASSED - Ready for measurements!")
         return True
         
     except ImportError:
-        print("\n✗ ERROR: xtralien library not installed")
-        print("Install with: pip install xtralien")
+        out("\n✗ ERROR: xtralien library not installed")
+        out("Install with: pip install xtralien")
         return False
         
     except Exception as e:
-        print(f"\n✗ ERROR: {e}")
-        print("\nTROUBLESHOOTING:")
-        print("1. Check USB connection to probe")
-        print("2. Ensure no other script is using the device")
-        print("3. Try unplugging and replugging the USB cable")
+        out(f"\n✗ ERROR: {e}")
+        out("\nTROUBLESHOOTING:")
+        out("1. Check USB connection to probe")
+        out("2. Ensure no other script is using the device")
+        out("3. Try unplugging and replugging the USB cable")
         return False
 
 
+async def check_devices():
+    """Run the stage and probe checks concurrently."""
+    # The stage check reports live (homing can take minutes); the probe
+    # check's output is held back and printed as one block afterwards so
+    # the two reports never interleave
+    probe_lines = []
+    stage_ok, probe_ok = await asyncio.gather(check_stage(), check_probe(out=probe_lines.append))
+    print("\n".join(probe_lines))
+    return stage_ok, probe_ok
+
+
 def main():
     print("\n" + "="*60)
     print("  AUTOMATED FOUR-POINT PROBE SYSTEM")
@@ -128,8 +238,7 @@ def main():
     print("="*60)
     
     # Check both devices
-    stage_ok = check_stage()
-    probe_ok = check_probe()
+    stage_ok, probe_ok = asyncio.run(check_devices())
     
     # Final summary
     print("\n" + "="*60)
@@ -1,19 +1,21 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -B
 """
 Automated Four-Point Probe Measurement System
 Combines Thorlabs stage positioning with xtralien four-point probe.
 Now includes Electrical Conductivity extraction.
 """
 
-import xtralien
+import asyncio
 import time
-import csv
 import os
 import sys
 import numpy as np
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
-from pylablib.devices import Thorlabs
+from pathlib import Path
+
+from check_connection import await_device, enable_low_latency, wait_stage
 
 # ================= CONFIGURATION =================
 # Device Ports
@@ -24,7 +26,9 @@ PROBE_PORT = '/dev/ttyACM0'
 CONTACT_HEIGHT_MM = 5.4      # Height where probe contacts sample
 STEPS_PER_MM = 34304
 CONTACT_HEIGHT_STEPS = int(CONTACT_HEIGHT_MM * STEPS_PER_MM)
-SETTLING_TIME = 1.0          # Seconds to wait after reaching height
+SETTLING_TIME = 1.0          # Max seconds to wait for current to settle
+SETTLING_TOLERANCE = 0.01    # Settled when consecutive readings differ by < 1%
+SETTLING_POLL_INTERVAL = 0.05  # Seconds between settling readings
 
 # Contact Verification
 TEST_VOLTAGE = 0.1           # V - small voltage to verify contact
@@ -35,6 +39,7 @@ RETRY_INCREMENT_MM = 0.1     # mm - how much to raise stage if no contact
 START_V = -0.5
 END_V = 0.5
 STEP_V = 0.02
+N_PTS = int(round((END_V - START_V) / STEP_V)) + 1
 CURRENT_LIMIT = 0.2          # 200mA max
 
 # Geometry & Calculation
@@ -44,49 +49,90 @@ CORRECTION_FACTOR = 4.532    # For 6cm x 6cm sample (Sheet Resistance)
 RESULTS_FOLDER = "results_automated"
 # =================================================
 
+# Results table layout (built once at import)
+TABLE_RULE = "-" * 80
+TABLE_HEADER = f"{'Set V':>8} | {'Meas V':>8} | {'Current (mA)':>12} | {'Rs (Ω/sq)':>10} | {'Cond (S/m)':>12}"
+TABLE_ROW = "{:>8.3f} | {:>8.3f} | {:>12.3f} | {:>10.2f} | {:>12.2e}"
+PROGRESS_BATCH = 10          # Table rows are written live in batches of this size
+
 
 class AutomatedProbeSystem:
+    __slots__ = ("stage", "probe", "sample_name", "thickness_m", "_io_pool", "_devices")
+    
     def __init__(self):
         self.stage = None
         self.probe = None
         self.sample_name = None
         self.thickness_m = None # Thickness in meters
+        self._io_pool = ThreadPoolExecutor(max_workers=2)  # CSV/plot writing
+        self._devices = ExitStack()  # Open device handles
         
+    def _close_device(self, device, name):
+        """Close one device handle and report it (ExitStack callback)."""
+        device.close()
+        print(f"✓ {name} shutdown complete")
+    
     def connect_devices(self):
         """Connect to both stage and probe."""
         print("\n" + "="*60)
         print("  CONNECTING TO DEVICES")
         print("="*60)
         
-        # Connect stage
-        try:
-            print(f"Connecting to Thorlabs stage ({STAGE_PORT})...")
-            self.stage = Thorlabs.KinesisMotor(STAGE_PORT, is_rack_system=False)
-            self.stage._enable_channel()
-            time.sleep(0.3)
-            
-            if not self.stage.is_homed():
-                print("ERROR: Stage is not homed!")
-                print("Please run 'check_connection.py' first.")
+        # Devices are closed automatically on any failure below; on success
+        # they are handed over to self._devices and closed in shutdown()
+        with ExitStack() as stack:
+            # Connect stage
+            try:
+                # Imported here to keep script startup fast
+                from pylablib.devices import Thorlabs
+                
+                print(f"Connecting to Thorlabs stage ({STAGE_PORT})...")
+                self.stage = Thorlabs.KinesisMotor(STAGE_PORT, is_rack_system=False)
+                stack.callback(self._close_device, self.stage, "Stage")
+                # pylablib's backend wraps serial.Serial as stage.instr.instr
+                if not enable_low_latency(STAGE_PORT, getattr(getattr(self.stage, "instr", None), "instr", None)):
+                    print(f"Note: low-latency mode unavailable on {STAGE_PORT}, using default USB latency")
+                self.stage._enable_channel()
+                time.sleep(0.3)
+                
+                if not self.stage.is_homed():
+                    print("ERROR: Stage is not homed!")
+                    print("Please run 'check_connection.py' first.")
+                    return False
+                    
+                print("✓ Stage connected and homed")
+                
+            except ImportError:
+                print("✗ ERROR: pylablib not installed")
+                print("Install with: pip install pylablib")
                 return False
                 
-            print("✓ Stage connected and homed")
+            except Exception as e:
+                print(f"✗ Stage connection failed: {e}")
+                return False
             
-        except Exception as e:
-            print(f"✗ Stage connection failed: {e}")
-            return False
-        
-        # Connect probe
-        try:
-            print(f"Connecting to four-point probe ({PROBE_PORT})...")
-            self.probe = xtralien.Device(PROBE_PORT)
-            print("✓ Probe connected")
+            # Connect probe
+            try:
+                import xtralien
+                
+                print(f"Connecting to four-point probe ({PROBE_PORT})...")
+                self.probe = xtralien.Device(PROBE_PORT)
+                stack.callback(self._close_device, self.probe, "Probe")
+                if not enable_low_latency(PROBE_PORT, getattr(self.probe, "connection", None)):
+                    print(f"Note: low-latency mode unavailable on {PROBE_PORT}, using default USB latency")
+                print("✓ Probe connected")
+                
+            except ImportError:
+                print("✗ ERROR: xtralien library not installed")
+                print("Install with: pip install xtralien")
+                return False
+                
+            except Exception as e:
+                print(f"✗ Probe connection failed: {e}")
+                return False
             
-        except Exception as e:
-            print(f"✗ Probe connection failed: {e}")
-            if self.stage:
-                self.stage.close()
-            return False
+            # Keep both devices open until shutdown()
+            self._devices = stack.pop_all()
         
         print("\n✓ All devices connected successfully!")
         return True
@@ -123,12 +169,44 @@ class AutomatedProbeSystem:
 
         print(f"Sample: {self.sample_name}")
     
-    def move_to_contact(self):
+    def _configure_probe_limits(self):
+        """Set SMU compliance limits and enable the output."""
+        self.probe.smu1.set.limiti(CURRENT_LIMIT, response=0)
+        self.probe.smu1.set.limitv(10.0, response=0)
+        self.probe.smu1.set.enabled(True, response=0)
+    
+    async def _settle(self):
+        """Wait until the test current stabilizes (SETTLING_TIME is a hard max)."""
+        print(f"Settling (max {SETTLING_TIME}s)...")
+        loop = asyncio.get_running_loop()
+        oneshot = self.probe.smu1.oneshot
+        start = time.monotonic()
+        prev = None
+        while time.monotonic() - start < SETTLING_TIME:
+            data = await await_device(loop.run_in_executor(None, oneshot, TEST_VOLTAGE))
+            meas_i = abs(float(data[0][1]))
+            # Zero current (no contact) never counts as settled
+            if prev is not None and prev > 0 and abs(meas_i - prev) < SETTLING_TOLERANCE * prev:
+                print(f"✓ Settled after {time.monotonic() - start:.2f}s")
+                break
+            prev = meas_i
+            await asyncio.sleep(SETTLING_POLL_INTERVAL)
+        else:
+            print(f"⚠ Current did not settle within {SETTLING_TIME}s")
+        self.probe.smu1.set.voltage(0, response=0)
+    
+    async def _move_stage(self, steps):
+        """Move the stage to an absolute position, stopping it if interrupted."""
+        self.stage.move_to(steps)
+        await wait_stage(self.stage, self.stage.is_moving)
+    
+    async def move_to_contact(self):
         """Move stage to contact height."""
         print("\n" + "="*60)
         print("  MOVING TO CONTACT POSITION")
         print("="*60)
         
+        loop = asyncio.get_running_loop()
         current_pos = self.stage.get_position()
         current_mm = current_pos / STEPS_PER_MM
         
@@ -136,46 +214,50 @@ class AutomatedProbeSystem:
         print(f"Target position: {CONTACT_HEIGHT_MM:.2f} mm")
         print("Moving...")
         
-        self.stage.move_to(CONTACT_HEIGHT_STEPS)
-        self.stage.wait_move()
+        # Configure the probe over its own port while the stage is moving
+        # (return_exceptions so a failure in one doesn't leave the other running)
+        for result in await asyncio.gather(
+            self._move_stage(CONTACT_HEIGHT_STEPS),
+            await_device(loop.run_in_executor(None, self._configure_probe_limits)),
+            return_exceptions=True,
+        ):
+            if isinstance(result, BaseException):
+                raise result
         
         final_pos = self.stage.get_position()
         final_mm = final_pos / STEPS_PER_MM
         print(f"✓ Reached: {final_mm:.2f} mm")
         
-        print(f"Settling for {SETTLING_TIME}s...")
-        time.sleep(SETTLING_TIME)
+        await self._settle()
         
         return final_mm
     
     def verify_contact(self, current_height_mm):
         """Verify probe is making contact with sample."""
-        print("\n" + "="*60)
-        print("  VERIFYING CONTACT")
-        print("="*60)
-        
-        # Configure probe for test
-        self.probe.smu1.set.limiti(CURRENT_LIMIT, response=0)
-        self.probe.smu1.set.limitv(10.0, response=0)
-        self.probe.smu1.set.enabled(True, response=0)
-        
-        # Apply test voltage
-        print(f"Applying test voltage: {TEST_VOLTAGE}V")
-        data = self.probe.smu1.oneshot(TEST_VOLTAGE)
-        
-        meas_v = float(data[0][0])
-        meas_i = abs(float(data[0][1]))
-        
-        print(f"Measured: V = {meas_v:.4f}V, I = {meas_i*1000:.4f}mA")
-        print(f"Threshold: {CONTACT_THRESHOLD*1000:.4f}mA")
-        
-        # Reset to 0V
-        self.probe.smu1.set.voltage(0, response=0)
-        
-        if meas_i >= CONTACT_THRESHOLD:
-            print("✓ GOOD CONTACT DETECTED!")
-            return True
-        else:
+        # Probe limits are already configured by move_to_contact, so a retry
+        # only needs to move the stage and measure again
+        while True:
+            print("\n" + "="*60)
+            print("  VERIFYING CONTACT")
+            print("="*60)
+            
+            # Apply test voltage
+            print(f"Applying test voltage: {TEST_VOLTAGE}V")
+            data = self.probe.smu1.oneshot(TEST_VOLTAGE)
+            
+            meas_v = float(data[0][0])
+            meas_i = abs(float(data[0][1]))
+            
+            print(f"Measured: V = {meas_v:.4f}V, I = {meas_i*1000:.4f}mA")
+            print(f"Threshold: {CONTACT_THRESHOLD*1000:.4f}mA")
+            
+            # Reset to 0V
+            self.probe.smu1.set.voltage(0, response=0)
+            
+            if meas_i >= CONTACT_THRESHOLD:
+                print("✓ GOOD CONTACT DETECTED!")
+                return True
+            
             print("⚠ WARNING: Low or no current detected")
             print("The probe may not be making good contact with the sample.")
             print(f"\nCurrent height: {current_height_mm:.2f} mm")
@@ -188,16 +270,7 @@ class AutomatedProbeSystem:
                 choice = input("\nEnter choice (1/2/3): ").strip()
                 
                 if choice == '1':
-                    # Retry at higher position
-                    new_height_mm = current_height_mm + RETRY_INCREMENT_MM
-                    new_height_steps = int(new_height_mm * STEPS_PER_MM)
-                    
-                    print(f"\nMoving to {new_height_mm:.2f} mm...")
-                    self.stage.move_to(new_height_steps)
-                    self.stage.wait_move()
-                    time.sleep(SETTLING_TIME)
-                    
-                    return self.verify_contact(new_height_mm)
+                    break
                 
                 elif choice == '2':
                     print("\nAborting measurement.")
@@ -209,113 +282,198 @@ class AutomatedProbeSystem:
                 
                 else:
                     print("Invalid choice. Please enter 1, 2, or 3.")
+            
+            # Retry at higher position
+            current_height_mm += RETRY_INCREMENT_MM
+            new_height_steps = int(current_height_mm * STEPS_PER_MM)
+            
+            print(f"\nMoving to {current_height_mm:.2f} mm...")
+            asyncio.run(self._move_stage(new_height_steps))
+            asyncio.run(self._settle())
+    
+    def _rs_sigma(self, meas_v, meas_i):
+        """Return |Rs| and conductivity for arrays of measured V and I."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Calculate sheet resistance (Rs)
+            rs = np.where(np.abs(meas_i) > 1e-7, meas_v / meas_i * CORRECTION_FACTOR, 0.0)
+            abs_rs = np.abs(rs)
+            
+            # Calculate Conductivity (sigma = 1 / (Rs * t))
+            # Avoid division by zero
+            sigma = np.where((abs_rs > 1e-9) & (self.thickness_m > 0),
+                             1.0 / (abs_rs * self.thickness_m), 0.0)
+        return abs_rs, sigma
+    
+    async def _sweep_pointwise(self, voltages, meas_v_arr, meas_i_arr, ok):
+        """Run the sweep as one oneshot per voltage, filling the given arrays."""
+        n_pts = len(voltages)
+        
+        # Hoist lookups out of the sweep loop
+        oneshot = self.probe.smu1.oneshot
+        fmt = TABLE_ROW.format
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        
+        # Indices of points read since the last table write; their rows are
+        # written every PROGRESS_BATCH points
+        batch = []
+        
+        def flush_rows():
+            if batch:
+                idx = np.array(batch)
+                abs_rs, sigma = self._rs_sigma(meas_v_arr[idx], meas_i_arr[idx])
+                rows = zip(voltages[idx], meas_v_arr[idx], meas_i_arr[idx] * 1000, abs_rs, sigma)
+                write("\n".join(fmt(*row) for row in rows) + "\n")
+                flush()
+                batch.clear()
+        
+        # The live table is skipped entirely under python -O (data still goes to the CSV)
+        if __debug__:
+            print(TABLE_RULE)
+            print(TABLE_HEADER)
+            print(TABLE_RULE)
+        
+        # Pipeline the sweep: oneshot runs in a worker thread, and the next
+        # point is dispatched as soon as the current one is read back, so
+        # its USB round trip overlaps with parsing of this one.
+        # Only one command is ever in flight on the probe.
+        submit = asyncio.get_running_loop().run_in_executor
+        pending = submit(None, oneshot, float(voltages[0])) if n_pts else None
+        
+        for k, set_v in enumerate(voltages):
+            error = None
+            try:
+                # Measure
+                data = await await_device(pending)
+            except Exception as e:
+                error = e
+            
+            if k + 1 < n_pts:
+                pending = submit(None, oneshot, float(voltages[k + 1]))
+            
+            if error is not None:
+                flush_rows()
+                print(f"Error at {set_v}V: {error}")
+                continue
+            
+            try:
+                # Extract
+                meas_v, meas_i = data[0][:2]
+                meas_v_arr[k] = float(meas_v)
+                meas_i_arr[k] = float(meas_i)
+                ok[k] = True
+                
+            except Exception as e:
+                flush_rows()
+                print(f"Error at {set_v}V: {e}")
+                continue
+            
+            if __debug__:
+                batch.append(k)
+                if len(batch) >= PROGRESS_BATCH:
+                    flush_rows()
+        
+        flush_rows()
     
-    def run_measurement(self):
+    async def run_measurement(self):
         """Perform the four-point probe measurement and calculate conductivity."""
         print("\n" + "="*60)
         print("  RUNNING MEASUREMENT")
         print("="*60)
         
         # Setup (already enabled from contact verification)
-        voltages = np.arange(START_V, END_V + STEP_V/1000, STEP_V)
-        results = []
+        voltages = np.linspace(START_V, END_V, N_PTS, dtype=np.float64)
+        n_pts = len(voltages)
+        
+        # Raw readings are stored as they arrive; Rs and sigma are computed
+        # vectorized, per table batch and once more for the final result
+        meas_v_arr = np.empty(n_pts)
+        meas_i_arr = np.empty_like(meas_v_arr)
+        ok = np.zeros(n_pts, dtype=bool)
         
         print(f"\nVoltage sweep: {START_V}V to {END_V}V (step: {STEP_V}V)")
         print(f"Assuming thickness: {self.thickness_m:.2e} m")
-        print("-" * 80)
-        print(f"{'Set V':>8} | {'Meas V':>8} | {'Current (mA)':>12} | {'Rs (Ω/sq)':>10} | {'Cond (S/m)':>12}")
-        print("-" * 80)
+        print(f"Sweeping {n_pts} points...")
         
-        for set_v in voltages:
-            try:
-                # Measure
-                data = self.probe.smu1.oneshot(float(set_v))
-                
-                # Extract
-                meas_v = float(data[0][0])
-                meas_i = float(data[0][1])
-                
-                # Calculate sheet resistance (Rs)
-                if abs(meas_i) > 1e-7:
-                    rs = (meas_v / meas_i) * CORRECTION_FACTOR
-                else:
-                    rs = 0
-                
-                # Calculate Conductivity (sigma = 1 / (Rs * t))
-                # Avoid division by zero
-                if abs(rs) > 1e-9 and self.thickness_m > 0:
-                    sigma = 1 / (abs(rs) * self.thickness_m)
-                else:
-                    sigma = 0
-
-                results.append([meas_i, meas_v, abs(rs), sigma])
-                print(f"{set_v:>8.3f} | {meas_v:>8.3f} | {meas_i*1000:>12.3f} | {abs(rs):>10.2f} | {sigma:>12.2e}")
-                
-            except Exception as e:
-                print(f"Error at {set_v}V: {e}")
+        await self._sweep_pointwise(voltages, meas_v_arr, meas_i_arr, ok)
+        
+        # Drop failed points
+        meas_v_arr = meas_v_arr[ok]
+        meas_i_arr = meas_i_arr[ok]
+        abs_rs, sigma = self._rs_sigma(meas_v_arr, meas_i_arr)
         
         print("\n✓ Measurement complete!")
-        return results
+        return np.column_stack([meas_i_arr, meas_v_arr, abs_rs, sigma])
     
     def save_results(self, data):
-        """Save measurement data to CSV and plot."""
-        print("\n" + "="*60)
-        print("  SAVING RESULTS")
-        print("="*60)
+        """Save measurement data to CSV and plot, returning the report lines."""
+        # Runs on the background save thread, so the caller does the printing
+        report = []
         
         # Create results folder
-        if not os.path.exists(RESULTS_FOLDER):
-            os.makedirs(RESULTS_FOLDER)
+        results_dir = Path(RESULTS_FOLDER)
+        results_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate filename
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = f"{RESULTS_FOLDER}/{self.sample_name}_{timestamp}"
+        filename = results_dir / f"{self.sample_name}_{timestamp}"
+        csv_path = filename.with_suffix(".csv")
+        png_path = filename.with_suffix(".png")
         
-        # Save CSV
-        with open(f"{filename}.csv", 'w', newline='') as f:
-            writer = csv.writer(f)
-            # Added Conductivity column
-            writer.writerow(["Current (A)", "Voltage (V)", "Sheet Resistance (Ohm/sq)", "Conductivity (S/m)"])
-            writer.writerows(data)
-        print(f"✓ Saved data: {filename}.csv")
+        # Save CSV in one np.savetxt call; "%s" writes the shortest round-trip repr
+        data = np.asarray(data, dtype=float).reshape(-1, 4)
+        np.savetxt(csv_path, data, delimiter=",", fmt="%s", comments="",
+                   header="Current (A),Voltage (V),Sheet Resistance (Ohm/sq),Conductivity (S/m)")
+        report.append(f"✓ Saved data: {csv_path}")
         
         # Calculate averages (filter outliers for Rs > 5 Ohm)
-        valid_rs = [r[2] for r in data if 5 < r[2] < 1000]
-        avg_rs = np.mean(valid_rs) if valid_rs else 0
+        rs_arr = data[:, 2]
+        sigma_arr = data[:, 3]
+        mask = (5 < rs_arr) & (rs_arr < 1000)
+        avg_rs = rs_arr[mask].mean() if mask.any() else 0.0
         
         # Calculate average conductivity
-        valid_sigma = [r[3] for r in data if r[3] > 0 and 5 < r[2] < 1000]
-        avg_sigma = np.mean(valid_sigma) if valid_sigma else 0
+        sigma_mask = (sigma_arr > 0) & mask
+        avg_sigma = sigma_arr[sigma_mask].mean() if sigma_mask.any() else 0.0
         
         # Save plot
-        currents = [row[0] for row in data]
-        voltages = [row[1] for row in data]
-        
-        plt.figure(figsize=(10, 6))
-        plt.plot(voltages, currents, 'b-o', markersize=3)
-        plt.title(f"IV Curve - {self.sample_name}\nAvg Rs: {avg_rs:.2f} Ω/sq | Avg $\sigma$: {avg_sigma:.2e} S/m")
-        plt.xlabel("Voltage (V)")
-        plt.ylabel("Current (A)")
-        plt.grid(True)
-        plt.savefig(f"{filename}.png", dpi=150)
-        print(f"✓ Saved plot: {filename}.png")
-        
-        print("-" * 40)
-        print(f"RESULTS SUMMARY")
-        print("-" * 40)
-        print(f"Average Sheet Resistance: {avg_rs:.4f} Ω/sq")
-        print(f"Average Conductivity:     {avg_sigma:.4e} S/m")
-        print("-" * 40)
+        currents = data[:, 0]
+        voltages = data[:, 1]
+        
+        # Headless Agg canvas - no pyplot state machine or GUI backend,
+        # and safe to render from the background save thread
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(figsize=(10, 6))
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        ax.plot(voltages, currents, 'b-o', markersize=3)
+        ax.set_title(f"IV Curve - {self.sample_name}\nAvg Rs: {avg_rs:.2f} Ω/sq | Avg $\\sigma$: {avg_sigma:.2e} S/m")
+        ax.set_xlabel("Voltage (V)")
+        ax.set_ylabel("Current (A)")
+        ax.grid(True)
+        canvas.print_figure(png_path, dpi=150)
+        report.append(f"✓ Saved plot: {png_path}")
+        
+        report += [
+            "-" * 40,
+            "RESULTS SUMMARY",
+            "-" * 40,
+            f"Average Sheet Resistance: {avg_rs:.4f} Ω/sq",
+            f"Average Conductivity:     {avg_sigma:.4e} S/m",
+            "-" * 40,
+        ]
+        return report
     
-    def return_home(self):
+    async def return_home(self):
         """Return stage to home position."""
         print("\n" + "="*60)
         print("  RETURNING TO HOME")
         print("="*60)
         
         print("Moving stage to home position...")
-        self.stage.move_to(0)
-        self.stage.wait_move()
+        await self._move_stage(0)
         
         final_pos = self.stage.get_position()
         print(f"✓ At home: {final_pos} steps")
@@ -330,20 +488,36 @@ class AutomatedProbeSystem:
             try:
                 self.probe.smu1.set.voltage(0, response=0)
                 self.probe.smu1.set.enabled(False, response=0)
-                self.probe.close()
-                print("✓ Probe shutdown complete")
             except:
                 pass
         
-        if self.stage:
-            try:
-                self.stage.close()
-                print("✓ Stage shutdown complete")
-            except:
-                pass
+        # Closes the probe, then the stage (registered in connect_devices);
+        # each handle reports itself as it is closed
+        try:
+            self._devices.close()
+        except:
+            pass
+        
+        self._io_pool.shutdown(wait=True)
+    
+    async def _save_and_return_home(self, data):
+        """Write results in the background while the stage moves home."""
+        loop = asyncio.get_running_loop()
+        save_fut = loop.run_in_executor(self._io_pool, self.save_results, data)
+        await self.return_home()
+        report = await save_fut
+        
+        # Printed only once the stage is home so the two steps don't interleave
+        print("\n" + "="*60)
+        print("  SAVING RESULTS")
+        print("="*60)
+        print("\n".join(report))
     
     def run(self):
         """Main execution sequence."""
+        # Interactive steps run outside the event loop so Ctrl-C at a prompt
+        # raises KeyboardInterrupt directly; only the device-bound phases
+        # are driven by asyncio.run
         try:
             # 1. Get sample details (Name & Thickness)
             self.get_sample_details()
@@ -353,23 +527,20 @@ class AutomatedProbeSystem:
                 return 1
             
             # 3. Move to contact height
-            current_height = self.move_to_contact()
+            current_height = asyncio.run(self.move_to_contact())
             
             # 4. Verify contact
             if not self.verify_contact(current_height):
                 print("\nMeasurement aborted by user.")
-                self.return_home()
+                asyncio.run(self.return_home())
                 self.shutdown()
                 return 1
             
             # 5. Run measurement
-            data = self.run_measurement()
-            
-            # 6. Save results
-            self.save_results(data)
+            data = asyncio.run(self.run_measurement())
             
-            # 7. Return home
-            self.return_home()
+            # 6-7. Save results (in the background) while the stage returns home
+            asyncio.run(self._save_and_return_home(data))
             
             # 8. Shutdown
             self.shutdown()